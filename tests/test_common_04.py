@@ -0,0 +1,51 @@
+""" Tests for the common module """
+from itertools import islice
+import pytest
+from ziffers import euclidian_rhythm, sum_dict, flatten, gen_primes
+
+@pytest.mark.parametrize(
+    "pulses,length,rotate,expected",
+    [
+        (3, 8, 0, [True, False, False, True, False, False, True, False]),
+        (5, 8, 0, [True, False, True, False, True, True, False, True]),
+        (3, 8, 1, [False, True, False, False, True, False, False, True]),
+        (8, 8, 0, [True]),
+    ],
+)
+def test_euclidian_rhythm(pulses: int, length: int, rotate: int, expected: list):
+    assert euclidian_rhythm(pulses, length, rotate) == expected
+
+@pytest.mark.parametrize(
+    "dicts,expected",
+    [
+        ([{"octave": 1, "text": "^"}], {"octave": 1, "text": "^"}),
+        (
+            [{"octave": -1, "text": "_"}, {"duration": 0.25, "text": "q"}, {"octave": -1, "text": "_"}],
+            {"octave": -2, "duration": 0.25, "text": "_q_"},
+        ),
+    ],
+)
+def test_sum_dict(dicts: list, expected: dict):
+    assert sum_dict(dicts) == expected
+
+@pytest.mark.parametrize(
+    "arr,expected",
+    [
+        ([1, [2, [3, [4]], 5], [], [[6]]], [1, 2, 3, 4, 5, 6]),
+        (3, [3]),
+        ([], []),
+    ],
+)
+def test_flatten(arr: list, expected: list):
+    assert flatten(arr) == expected
+
+def test_gen_primes():
+    # 20000 primes span several sieve segments, including the largest size
+    limit = 230000
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for number in range(2, int(limit**0.5) + 1):
+        if sieve[number]:
+            sieve[number * number::number] = bytes(len(range(number * number, limit, number)))
+    expected = [number for number in range(limit) if sieve[number]][:20000]
+    assert list(islice(gen_primes(), 20000)) == expected
@@ -1,6 +1,6 @@
 """ Test cases for the parser """
 import pytest
-from ziffers import zparse
+from ziffers import zparse, converters
 
 @pytest.mark.parametrize(
     "pattern,expected",
@@ -11,4 +11,17 @@ from ziffers import zparse
     ],
 )
 def test_multi_var(pattern: str, expected: list):
-    assert zparse(pattern).collect(6, keys=["pitch_class", "duration"]) == [item*2 for item in expected]
\ No newline at end of file
+    assert zparse(pattern).collect(6, keys=["pitch_class", "duration"]) == [item*2 for item in expected]
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        ("q 1 r 2", [0.0, 0.75, 1.5]),
+        ("q 1 r 024", [0.0, 0.75, 1.5, 1.5, 1.5]),
+    ],
+)
+def test_csound_score_after_rest(pattern: str, expected: list, monkeypatch):
+    # Building the score string does not need ctcsound itself
+    monkeypatch.setattr(converters, "csound_imported", True)
+    score = converters.ziffers_to_csound_score(zparse(pattern), bpm=80)
+    assert [float(line.split()[2]) for line in score.splitlines()] == expected
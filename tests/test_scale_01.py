@@ -49,3 +49,8 @@ def test_note_to_midi(pitch_classes: str, expected: int):
     assert [
         scale.note_from_pc(root=60, pitch_class=val, intervals="Ionian")[0] for val in pitch_classes
     ] == expected
+
+
+def test_float_scale_after_named_scale():
+    assert scale.note_from_pc(60, 2, "major") == (64, None)
+    assert scale.note_from_pc(60, 2, (2.0, 2.0, 1.0, 2.0, 2.0, 2.0, 1.0)) == (64.0, 8192)
@@ -1,6 +1,6 @@
 """ Test cases for the parser """
 import pytest
-from ziffers import zparse, get_items
+from ziffers import zparse, get_items, parse_scala
 
 # pylint: disable=missing-function-docstring, line-too-long, invalid-name
 
@@ -66,6 +66,11 @@ def test_pitch_classes(pattern: str, expected: list):
 def test_pitch_octaves(pattern: str, expected: list):
     assert get_items(zparse(pattern),len(expected)*2,"octave") == expected*2
 
+def test_octave_items_keep_whitespace():
+    values = zparse("^ 1 _ 2 <3> 4").values
+    assert [type(item).__name__ for item in values[:3]] == ["OctaveAdd", "Whitespace", "Pitch"]
+    assert [item.text for item in values] == ["^", " ", "1", " ", "_", " ", "2", " ", "<3>", " ", "4"]
+
 
 @pytest.mark.parametrize(
     "pattern,expected",
@@ -208,3 +213,51 @@ def test_operations(pattern: str, expected: list):
 def test_cycles(pattern: str, expected: list):
     zparse.cache_clear() # Clear cache for cycles
     assert get_items(zparse(pattern),4,"note") == expected
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+     ("(q e)<>(1 2 3)", [0.25, 0.125, 0.25]),
+     ("(024 e)<>(1 2 3 4)", [0.25, 0.25, 0.125, 0.125, 0.125, 0.125]),
+     ("(1 [2 3])<>(q e s h)", [0.25, 0.125, 0.125, 0.125, 0.03125, 0.03125]),
+     ("(<1 2> 3)<>(q e s)", [0.25, 0.25, 0.125, 0.25, 0.25, 0.125]),
+    ]
+)
+def test_cyclic_zip(pattern: str, expected: list):
+    assert get_items(zparse(pattern),len(expected),"duration") == expected
+
+def test_cache_key_order():
+    assert zparse("1 2", key="D", scale="minor") is zparse("1 2", scale="minor", key="D")
+
+def test_unhashable_options():
+    assert zparse("1 2", scale=[2, 2, 1, 2, 2, 2, 1]).notes() == [62, 64]
+
+@pytest.mark.parametrize(
+    "operation,expected",
+    [
+     ("1+2*3", "7"),
+     ("2*3*2", "12"),
+     ("5+3", "8"),
+     ("6&3", "2"),
+    ]
+)
+def test_scala_operations(operation: str, expected: str):
+    assert parse_scala(operation) == parse_scala(expected)
+
+@pytest.mark.parametrize("scale", ["Chromatic", "major"])
+def test_named_scale_after_cents_scale(scale: str):
+    zparse.cache_clear()
+    zparse("0 1 2 3 4", scale="100. 200. 300. 400. 500. 600. 700. 800. 900. 1000. 1100. 1200.")
+    pitches = zparse("0 1 2 3 4", scale=scale).evaluated_values
+    assert all(isinstance(pitch.note, int) and pitch.pitch_bend is None for pitch in pitches)
+
+def test_float_scale_cached_apart_from_int_scale():
+    zparse.cache_clear()
+    zparse("0 1 2 3 4", scale=(2, 2, 1, 2, 2, 2, 1))
+    pitches = zparse("0 1 2 3 4", scale=(2.0, 2.0, 1.0, 2.0, 2.0, 2.0, 1.0)).evaluated_values
+    assert all(pitch.pitch_bend is not None for pitch in pitches)
+
+def test_dict_skips_iterator():
+    parsed = zparse("q 1 2")
+    next(parsed)
+    assert "iterator" not in parsed.dict()
@@ -1,5 +1,6 @@
 """ Ziffers item classes """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
+from copy import copy
 from math import floor
 import random
 from ..scale import (
@@ -12,7 +13,7 @@ from ..scale import (
 from ..common import repeat_text
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Meta:
     """Abstract class for all Ziffers items"""
 
@@ -56,7 +57,7 @@ class Meta:
         return {k: str(v) for k, v in asdict(self).items()}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Item(Meta):
     """Class for all Ziffers text based items"""
 
@@ -85,14 +86,14 @@ class Item(Meta):
         return {key: getattr(self, key) for key in keys if hasattr(self, key)}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Whitespace:
     """Class for whitespace"""
 
     text: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Modification(Item):
     """Superclass for pitch modifications"""
 
@@ -104,7 +105,7 @@ class Modification(Item):
         return {self.key: self.value}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DurationChange(Modification):
     """Class for changing duration"""
 
@@ -112,7 +113,7 @@ class DurationChange(Modification):
     key: str = field(default="duration", repr=False, init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class OctaveChange(Modification):
     """Class for changing octave"""
 
@@ -120,7 +121,7 @@ class OctaveChange(Modification):
     key: str = field(default="octave", repr=False, init=False)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OctaveAdd(Modification):
     """Class for modifying octave"""
 
@@ -128,7 +129,7 @@ class OctaveAdd(Modification):
     key: str = field(default="octave", repr=False, init=False)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Event(Item):
     """Abstract class for events with duration"""
 
@@ -144,7 +145,7 @@ class Event(Item):
         return self.beat
 
 
-@dataclass
+@dataclass(slots=True)
 class Rest(Event):
     """Class for rests"""
 
@@ -169,7 +170,7 @@ class Rest(Event):
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Measure(Item):
     """Class for measures/bars. Used to reset default options."""
 
@@ -186,7 +187,7 @@ class Measure(Item):
         self.measure = next_measure
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Pitch(Event):
     """Class for pitch in time"""
 
@@ -201,7 +202,8 @@ class Pitch(Event):
     degrees: bool = field(default=None)
 
     def __post_init__(self):
-        super().__post_init__()
+        # Explicit super() arguments as slotted dataclasses are recreated classes
+        super(Pitch, self).__post_init__()
         if self.text is None:
             self.text = str(self.pitch_class)
             self.update_note()
@@ -296,7 +298,7 @@ class Pitch(Event):
         return self.pitch_class
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RandomPitch(Event):
     """Class for random pitch"""
 
@@ -320,14 +322,14 @@ class RandomPitch(Event):
         return random.randint(0, scale_length)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RandomPercent(Item):
     """Class for random percent"""
 
     percent: float = field(default=None)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Chord(Event):
     """Class for chords"""
 
@@ -345,6 +347,14 @@ class Chord(Event):
         if self.inversions is not None:
             self.invert(self.inversions)
 
+    def __copy__(self):
+        """Copy chord with its own pitch objects, as those are updated in place"""
+        new_chord = self.__class__.__new__(self.__class__)
+        for item_field in fields(self):
+            setattr(new_chord, item_field.name, getattr(self, item_field.name))
+        new_chord.pitch_classes = [copy(pitch) for pitch in self.pitch_classes]
+        return new_chord
+
     @property
     def note(self):
         """Synonym for notes"""
@@ -426,10 +436,10 @@ class Chord(Event):
         self.durations = durations
         self.duration = durations[0]
         self.beats = beats
-        self.text = "".join([val.text for val in self.pitch_classes])
+        self.text = "".join(val.text for val in self.pitch_classes)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RomanNumeral(Event):
     """Class for roman numbers"""
 
@@ -496,21 +506,21 @@ class RomanNumeral(Event):
         return chord
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Function(Event):
     """Class for functions"""
 
     run: ... = field(default=None)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FunctionList(Event):
     """Class for functions"""
 
     values: list
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class VariableAssignment(Item):
     """Class for defining variables"""
 
@@ -519,33 +529,33 @@ class VariableAssignment(Item):
     pre_eval: bool
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Variable(Event):
     """Class for using variables"""
 
     name: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Sample(Event):
     """Class for samples"""
 
     name: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SampleList(Event):
     """Class for using multiple samples"""
 
     values: list
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class VariableList(Item):
     """Class for using variables"""
 
     values: list
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Integer(Item):
     """Class for integers"""
 
@@ -557,7 +567,7 @@ class Integer(Item):
         return self.value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RandomInteger(Item):
     """Class for random integer"""
 
@@ -565,7 +575,7 @@ class RandomInteger(Item):
     max: int
 
     def __post_init__(self):
-        super().__post_init__()
+        super(RandomInteger, self).__post_init__()
         if self.min > self.max:
             new_max = self.min
             self.min = self.max
@@ -577,7 +587,7 @@ class RandomInteger(Item):
         return random.randint(self.min, self.max)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Cyclic(Item):
     """Class for cyclic sequences"""
 
@@ -587,13 +597,13 @@ class Cyclic(Item):
     wrap_end: str = field(default=">", repr=False)
 
     def __post_init__(self):
-        super().__post_init__()
+        super(Cyclic, self).__post_init__()
         self.text = self.__collect_text()
         self.values = [val for val in self.values if not isinstance(val, Whitespace)]
 
     def __collect_text(self) -> str:
         """Collect text value from values"""
-        text = "".join([val.text for val in self.values])
+        text = "".join(val.text for val in self.values)
         if self.wrap_start is not None:
             text = self.wrap_start + text
         if self.wrap_end is not None:
@@ -609,7 +619,7 @@ class Cyclic(Item):
         return value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Range(Item):
     """Class for range"""
 
@@ -631,14 +641,14 @@ class Range(Item):
             yield Pitch(pitch_class=self.start, kwargs=merged_options)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Operator(Item):
     """Class for math operators"""
 
     value: ...
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Atom(Item):
     """Class for evaluable atoms"""
 
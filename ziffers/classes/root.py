@@ -1,13 +1,14 @@
 """Root class for Ziffers object"""
 
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass, field, asdict
 from itertools import islice, cycle
 from ..defaults import DEFAULT_OPTIONS
 from .items import Item, Pitch, Chord, Event, Rest
 from .sequences import Sequence, Subdivision
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Ziffers(Sequence):
     """Main class for holding options and the current state"""
 
@@ -15,7 +16,7 @@ class Ziffers(Sequence):
     start_options: dict = None
     loop_i: int = field(default=0, init=False)
     cycle_i: int = field(default=0, init=False)
-    iterator = None
+    iterator: Iterator = field(default=None, init=False, repr=False, compare=False)
     current: Item = field(default=None)
     cycle_length: int = field(default=0, init=False)
 
@@ -33,6 +34,10 @@ class Ziffers(Sequence):
     def __len__(self):
         return len(self.evaluated_values)
 
+    def dict(self):
+        """Returns safe dict from the dataclass without the iterator"""
+        return {k: str(v) for k, v in asdict(self).items() if k != "iterator"}
+
     def __iter__(self):
         return self
 
@@ -4,7 +4,7 @@ from itertools import product
 from math import floor
 import random
 from types import LambdaType
-from copy import deepcopy
+from copy import copy, deepcopy
 import operator
 from ..defaults import DEFAULT_OPTIONS
 from ..common import cyclic_zip, euclidian_rhythm, flatten
@@ -36,6 +36,14 @@ from .items import (
     SampleList,
 )
 
+# Items that a shallow copy makes independent, Chord copies its pitches in __copy__
+LEAF_ITEMS = (Pitch, Rest, Chord, Integer, DurationChange, OctaveChange, OctaveAdd)
+
+
+def copy_item(item: Meta) -> Meta:
+    """Copy item shallowly if it has no nested items, otherwise deeply"""
+    return copy(item) if isinstance(item, LEAF_ITEMS) else deepcopy(item)
+
 
 # TODO: Could be refactored to each class?
 def resolve_item(item: Meta, options: dict):
@@ -225,7 +233,7 @@ def create_pitch(current: Item, options: dict) -> Pitch:
     return new_pitch
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Sequence(Meta):
     """Class for sequences of items"""
 
@@ -237,7 +245,7 @@ class Sequence(Meta):
     evaluated_values: list = field(default=None)
 
     def __post_init__(self):
-        super().__post_init__()
+        super(Sequence, self).__post_init__()
         self.text = self.__collect_text()
         self.update_local_options()
 
@@ -261,7 +269,7 @@ class Sequence(Meta):
 
     def __collect_text(self) -> str:
         """Collect text value from values"""
-        text = "".join([val.text for val in self.values])
+        text = "".join(val.text for val in self.values)
         if self.wrap_start is not None:
             text = self.wrap_start + text
         if self.wrap_end is not None:
@@ -295,14 +303,14 @@ class Sequence(Meta):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PolyphonicSequence:
     """Class for polyphonic sequence"""
 
     values: list
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ListSequence(Sequence):
     """Class for Ziffers list sequences"""
 
@@ -310,7 +318,7 @@ class ListSequence(Sequence):
     wrap_end: str = field(default=")", repr=False)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RepeatedListSequence(Sequence):
     """Class for Ziffers list sequences"""
 
@@ -328,7 +336,7 @@ class RepeatedListSequence(Sequence):
                 yield from resolve_item(item, options)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Subdivision(Sequence):
     """Class for subdivisions"""
 
@@ -354,7 +362,7 @@ class Subdivision(Sequence):
                 yield item
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ListOperation(Sequence):
     """Class for list operations"""
 
@@ -476,7 +484,7 @@ class ListOperation(Sequence):
                         new_chord = Chord(pitch_classes=new_pitches, kwargs=options)
                         new_chord.update_notes()
                         new_chord.text = "".join(
-                            [val.text for val in new_chord.pitch_classes]
+                            val.text for val in new_chord.pitch_classes
                         )
                         arp_items.append(new_chord)
 
@@ -498,7 +506,7 @@ class ListOperation(Sequence):
             """Cyclic zip operaiton, eg. (q e)<>(1 2 3)"""
             left = list(_filter_whitespace(left))
             right = list(_filter_whitespace(right))
-            result = Sequence(values=cyclic_zip(left, right))
+            result = Sequence(values=cyclic_zip(left, right, copy_item))
             return _filter_operation(result, options)
 
         def _python_operations(left, right, options):
@@ -596,7 +604,7 @@ class ListOperation(Sequence):
         return left
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Eval(Sequence):
     """Class for evaluation notation"""
 
@@ -621,7 +629,7 @@ class Eval(Sequence):
         return self.evaluated_values
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LispOperation(Sequence):
     """Class for lisp-like operations: (+ 1 2 3) etc."""
 
@@ -629,7 +637,7 @@ class LispOperation(Sequence):
     operator: operator
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Operation(Sequence):
     """Class for sequential operations"""
 
@@ -639,7 +647,7 @@ class Operation(Sequence):
         return eval(self.text)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RepeatedSequence(Sequence):
     """Class for repeats"""
 
@@ -696,7 +704,7 @@ class RepeatedSequence(Sequence):
                 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Euclid(Item):
     """Class for euclidean cycles"""
 
@@ -1,28 +1,38 @@
 """ Common methods used in parsing """
 import re
-from copy import deepcopy
+from collections import deque
+from collections.abc import Callable
+from functools import lru_cache
+from itertools import chain, cycle
 
 
 def flatten(arr: list) -> list:
     """Flattens array"""
-    return (
-        flatten(arr[0]) + (flatten(arr[1:]) if len(arr) > 1 else [])
-        if isinstance(arr, list)
-        else [arr]
-    )
+    # Fast path for lists that are already flat
+    if type(arr) is list and list not in map(type, arr):
+        return arr.copy()
+    return list(flatten_iter(arr))
+
+
+def flatten_iter(arr: list):
+    """Yields items from nested lists in order without recursion"""
+    stack = [iter((arr,))]
+    while stack:
+        for item in stack[-1]:
+            # Parser output only nests plain lists, subclasses are not expected
+            if type(item) is list:
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
 
 
 def rotate(arr, k):
-    """Rotates array"""
-    # Calculate the effective rotation amount (mod the array length)
-    k = k % len(arr)
-    # Rotate the array to the right
-    if k > 0:
-        arr = arr[-k:] + arr[:-k]
-    # Rotate the array to the left
-    elif k < 0:
-        arr = arr[-k:] + arr[:-k]
-    return arr
+    """Rotates array to the right by k (to the left if k is negative)"""
+    rotated = deque(arr)
+    rotated.rotate(k)
+    return list(rotated)
 
 
 def repeat_text(pos, neg, times):
@@ -36,13 +46,13 @@ def repeat_text(pos, neg, times):
 
 def sum_dict(arr: list[dict]) -> dict:
     """Sums a list of dicts: [{a:3,b:3},{b:1}] -> {a:3,b:4}"""
-    result = arr[0]
+    result = dict(arr[0])
+    # Most items have a single prefix
+    if len(arr) == 1:
+        return result
     for element in arr[1:]:
-        for key in element.keys():
-            if key in result:
-                result[key] = result[key] + element[key]
-            else:
-                result[key] = element[key]
+        for key, value in element.items():
+            result[key] = result[key] + value if key in result else value
     return result
 
 
@@ -65,52 +75,65 @@ def string_rewrite(axiom: str, rules: dict):
             print(string_rewrite("1", rules))
     """
 
+    pattern, dispatch = _compile_rules(tuple(rules.items()))
+
     def _apply_rules(match):
-        for key, value in rules.items():
-            if re.match(key, match.group(0)):
+        token = match.group(0)
+        for key, value, argcount in dispatch:
+            if key.match(token):
                 if callable(value):
-                    yield value(
-                        *match.groups()
-                    ) if value.__code__.co_argcount > 0 else value()
-                yield value
-
-    pattern = re.compile("|".join(rules.keys()))
-    return pattern.sub(lambda m: next(_apply_rules(m)), axiom)
+                    return value(*match.groups()) if argcount > 0 else value()
+                return value
+        return token
+
+    return pattern.sub(_apply_rules, axiom)
+
+
+@lru_cache
+def _compile_rules(rules: tuple) -> tuple:
+    """Compile rewrite rules into alternation pattern and dispatch table"""
+    pattern = re.compile("|".join(key for key, _ in rules))
+    dispatch = tuple(
+        (
+            re.compile(key),
+            value,
+            value.__code__.co_argcount if callable(value) else 0,
+        )
+        for key, value in rules
+    )
+    return pattern, dispatch
 
 
 def euclidian_rhythm(pulses: int, length: int, rot: int = 0):
     """Calculate Euclidean rhythms. Original algorithm by Thomas Morrill."""
+    return list(_euclidian_onsets(pulses, length, rot))
 
-    def _starts_descent(arr, index):
-        length = len(arr)
-        next_index = (index + 1) % length
-        return arr[index] > arr[next_index]
 
-    def rotation(arr, idx):
-        return arr[-idx:] + arr[:-idx]
+@lru_cache
+def _euclidian_onsets(pulses: int, length: int, rot: int) -> tuple:
+    """Cached onsets for euclidian_rhythm"""
 
     if pulses >= length:
-        return [True]
+        return (True,)
 
     res_list = [pulses * t % length for t in range(-1, length - 1)]
-    bool_list = [_starts_descent(res_list, index) for index in range(length)]
+    # Onset wherever the sequence descends compared to its successor
+    bool_list = [
+        cur > nxt for cur, nxt in zip(res_list, res_list[1:] + res_list[:1])
+    ]
 
-    return rotation(bool_list, rot)
+    return tuple(rotate(bool_list, rot))
 
 
-def cyclic_zip(first: list, second: list) -> list:
+def cyclic_zip(first: list, second: list, copy_item: Callable) -> list:
     """Cyclic zip method
 
     Args:
         first (list): First list is cycled
         second (list): Second list
+        copy_item (Callable): Copies each zipped item
 
     Returns:
         list: Cyclicly zipped list
     """
-    result = []
-    s_length = len(second)
-    f_length = len(first)
-    for i in range(s_length):
-        result.append([first[i % f_length], second[i]])
-    return [deepcopy(item) for sublist in result for item in sublist]
+    return [copy_item(item) for item in chain.from_iterable(zip(cycle(first), second))]
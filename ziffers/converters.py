@@ -13,6 +13,14 @@ try:
 except (ImportError, TypeError) as Error:
     csound_imported: bool = False
 
+# Csound events for each item type as (frequencies, durations, length).
+# Rests are written with frequency 0.
+CSOUND_EVENTS = {
+    Pitch: lambda item: ((item.get_freq(),), (item.get_duration(),), item.get_duration()),
+    Rest: lambda item: ((None,), (item.get_duration(),), item.get_duration()),
+    Chord: lambda item: (item.get_freq(), item.get_duration(), max(item.get_duration())),
+}
+
 def ziffers_to_csound_score(ziffers: Ziffers, bpm: int=80, amp: float=1500, instr: (int|str)=1) -> str:
     """ Transform Ziffers object to Csound score in format:
         i {instrument} {start time} {duration} {amplitude} {frequency} """
@@ -20,20 +28,20 @@ def ziffers_to_csound_score(ziffers: Ziffers, bpm: int=80, amp: float=1500, inst
     if not csound_imported:
         raise ImportError("Install Csound")
 
-    score = ""
+    score = []
     instr = f'"{instr}"' if isinstance(instr, str) else instr
+    seconds_per_whole = 4 * 60 / bpm
     start_time = 0
     for item in ziffers.evaluated_values:
-        if isinstance(item, Chord):
-            for freq, dur in zip(item.get_freq(), item.get_duration()):
-                score += f"i {instr} {start_time} {dur * 4 * 60 / bpm} {amp} {freq:.2f}\n"
-            start_time += max(item.get_duration()) * 4 * 60 / bpm
-        elif isinstance(item, Rest):
-            score += f"i {instr} {start_time} {item.get_duration() * 4 * 60 / bpm} {amp} 0\n"
-        elif isinstance(item, Pitch):
-            score += f"i {instr} {start_time} {item.get_duration() * 4 * 60 / bpm} {amp} {item.get_freq():.2f}\n"
-            start_time += item.get_duration() * 4 * 60 / bpm
-    return score
+        events = CSOUND_EVENTS.get(type(item))
+        if events is None:
+            continue
+        freqs, durations, length = events(item)
+        for freq, dur in zip(freqs, durations):
+            freq = "0" if freq is None else f"{freq:.2f}"
+            score.append(f"i {instr} {start_time} {dur * seconds_per_whole} {amp} {freq}\n")
+        start_time += length * seconds_per_whole
+    return "".join(score)
 
 def to_music21(expression: str | Ziffers, **options):
     """Helper for passing options to the parser"""
@@ -41,9 +49,6 @@ def to_music21(expression: str | Ziffers, **options):
     if not music21_imported:
         raise ImportError("Install Music21 library")
 
-    # Register the ZiffersMusic21 converter
-    converter.registerSubConverter(ZiffersMusic21)
-
     if isinstance(expression, Ziffers):
         if options:
             options["preparsed"] = expression
@@ -71,6 +76,25 @@ def set_musescore_path(path: str):
 
 if music21_imported:
 
+    def _music21_note(item: Pitch):
+        """Create Music21 note from pitch"""
+        m_item = note.Note(item.note)
+        m_item.duration.quarterLength = item.duration * 4
+        return m_item
+
+    def _music21_chord(item: Chord):
+        """Create Music21 chord from chord"""
+        m_item = chord.Chord(item.notes)
+        m_item.duration.quarterLength = item.duration * 4
+        return m_item
+
+    # Music21 element constructors for each item type
+    MUSIC21_ELEMENTS = {
+        Pitch: _music21_note,
+        Rest: lambda item: note.Rest(item.duration * 4),
+        Chord: _music21_chord,
+    }
+
     # pylint: disable=locally-disabled, invalid-name, unused-argument, attribute-defined-outside-init
     class ZiffersMusic21(converter.subConverters.SubConverter):
         """Ziffers converter to Music21"""
@@ -117,15 +141,15 @@ if music21_imported:
             if "bpm" in options:
                 note_stream.append(tempo.MetronomeMark(number=options["bpm"]))
             
+            # Collect the notes first and append them in one batch
+            m_items = []
             for item in parsed:
-                if isinstance(item, Pitch):
-                    m_item = note.Note(item.note)
-                    m_item.duration.quarterLength = item.duration * 4
-                elif isinstance(item, Rest):
-                    m_item = note.Rest(item.duration * 4)
-                elif isinstance(item, Chord):
-                    m_item = chord.Chord(item.notes)
-                    m_item.duration.quarterLength = item.duration * 4
-                note_stream.append(m_item)
+                create_element = MUSIC21_ELEMENTS.get(type(item))
+                if create_element is not None:
+                    m_items.append(create_element(item))
+            note_stream.append(m_items)
             # TODO: Is this ok?
-            self.stream = note_stream.makeMeasures()
\ No newline at end of file
+            self.stream = note_stream.makeMeasures()
+
+    # Register the ZiffersMusic21 converter once on import
+    converter.registerSubConverter(ZiffersMusic21)
@@ -49,6 +49,14 @@ DEFAULT_DURS = MappingProxyType({
     "z": 0.0,      # 0
 })
 
+# Durations for plain duration characters followed by 0-6 dots
+DOTTED_DURS = MappingProxyType({
+    (key, dots): value * (2.0 - (1.0 / (2 * dots))) if dots > 0 else value
+    for key, value in DEFAULT_DURS.items()
+    if len(key) == 1
+    for dots in range(7)
+})
+
 DEFAULT_OCTAVE = 4
 
 DEFAULT_OPTIONS = MappingProxyType({
@@ -124,6 +132,17 @@ CIRCLE_OF_FIFTHS = (
     "Fs",
 )
 
+# Number of sharps (positive) or flats (negative) in the key of each note name
+FIFTHS_ACCIDENTALS = MappingProxyType({
+    name: index - 6 for index, name in enumerate(CIRCLE_OF_FIFTHS)
+})
+
+# Number of sharps or flats in the key for each semitone
+PITCH_CLASS_ACCIDENTALS = MappingProxyType({
+    interval: FIFTHS_ACCIDENTALS[name]
+    for interval, name in INTERVALS_TO_NOTES.items()
+})
+
 MODES = (
     "MAJOR",
     "IONIAN",
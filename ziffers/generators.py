@@ -1,35 +1,44 @@
 """Collection of generators"""
 
 
-# Sieve of Eratosthenes
-# Based on code by David Eppstein, UC Irvine, 28 Feb 2002
-# http://code.activestate.com/recipes/117119/
+# Segmented Sieve of Eratosthenes over odd numbers
 def gen_primes():
     """Generate an infinite sequence of prime numbers."""
-    # Maps composites to primes witnessing their compositeness.
-    # This is memory efficient, as the sieve is not "run forward"
-    # indefinitely, but only as long as required by the current
-    # number being tested.
-    sieve = {}
+    yield 2
 
-    # The running integer that's checked for primeness
-    current = 2
+    # Odd primes found so far. Each one strikes out its multiples from the
+    # following segments once the segment reaches its square.
+    primes = []
+
+    # Segments cover odd numbers only: index i stands for low + 2 * i.
+    # Segments start small so that taking a few primes stays cheap.
+    low = 3
+    size = 64
 
     while True:
-        if current not in sieve:
-            # current is a new prime.
-            # Yield it and mark its first multiple that isn't
-            # already marked in previous iterations
-            yield current
-            sieve[current * current] = [current]
-        else:
-            # current is composite. sieve[current] is the list of primes that
-            # divide it. Since we've reached current, we no longer
-            # need it in the map, but we'll mark the next
-            # multiples of its witnesses to prepare for larger
-            # numbers
-            for composite in sieve[current]:
-                sieve.setdefault(composite + current, []).append(composite)
-            del sieve[current]
-
-        current += 1
+        high = low + 2 * size
+        sieve = bytearray(size)
+        for prime in primes:
+            if prime * prime >= high:
+                break
+            _strike_multiples(sieve, low, prime)
+
+        for index in range(size):
+            if not sieve[index]:
+                prime = low + 2 * index
+                yield prime
+                primes.append(prime)
+                if prime * prime < high:
+                    _strike_multiples(sieve, low, prime)
+
+        low = high
+        size = min(size * 2, 1 << 16)
+
+
+def _strike_multiples(sieve: bytearray, low: int, prime: int):
+    """Mark odd multiples of the prime in the segment starting from low"""
+    start = max(prime * prime, -(-low // prime) * prime)
+    if start % 2 == 0:
+        start += prime
+    first = (start - low) // 2
+    sieve[first::prime] = b"\x01" * len(range(first, len(sieve), prime))
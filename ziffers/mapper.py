@@ -1,5 +1,8 @@
 """ Lark transformer for mapping Lark tokens to Ziffers objects """
 import random
+import re
+from functools import lru_cache
+from types import MappingProxyType
 from lark import Transformer, Token
 from .scale import cents_to_semitones, ratio_to_cents, monzo_to_cents
 from .classes.root import Ziffers
@@ -37,10 +40,50 @@ from .classes.items import (
     VariableList,
     Measure,
 )
-from .common import flatten, sum_dict
-from .defaults import DEFAULT_DURS, OPERATORS
+from .common import sum_dict
+from .defaults import DEFAULT_DURS, DOTTED_DURS, OPERATORS
 from .scale import parse_roman
 
+# Patterns for the bounds of the random integer, range and euclid tokens
+RANDOM_INTEGER_RE = re.compile(r"\((-?\d+),(-?\d+)\)")
+RANGE_RE = re.compile(r"(-?\d+)\.\.(-?\d+)")
+EUCLID_RE = re.compile(r"<(\d+),(\d+)(?:,(\d+))?>")
+
+# Repeats used when the repeat count is omitted, shared as it is never modified
+DEFAULT_REPEATS = Integer(text="2", value=2)
+
+# Pitch classes written as letters
+PITCH_LETTERS = MappingProxyType({"T": 10, "E": 11, "-T": -10, "-E": -11})
+
+# Binding strength of the operators in Scala operations, highest first
+SCALA_PRECEDENCE = MappingProxyType(
+    {"*": 4, "%": 4, "+": 3, "-": 3, "<<": 2, ">>": 2, "&": 1, "|": 0}
+)
+
+
+@lru_cache
+def whitespace(text: str) -> Whitespace:
+    """Return shared whitespace item. Whitespace is never modified after parsing."""
+    return Whitespace(text=text)
+
+
+def dotted_duration(dchar: str, dots: int) -> float:
+    """Return duration for the duration character with number of dots"""
+    val = DOTTED_DURS.get((dchar, dots))
+    if val is None:
+        val = DEFAULT_DURS[dchar] * (2.0 - (1.0 / (2 * dots)))
+    return val
+
+
+@lru_cache
+def split_dots(text: str) -> tuple:
+    """Return duration character and number of dots from dotted duration, ex: e.."""
+    dur = text.split(".", 1)
+    dots = 0
+    if len(dur) > 1:
+        dots = len(dur[1]) + 1
+    return (dur[0], dots)
+
 
 # pylint: disable=locally-disabled, unused-argument, too-many-public-methods, invalid-name
 class ZiffersTransformer(Transformer):
@@ -51,8 +94,8 @@ class ZiffersTransformer(Transformer):
         return Ziffers(values=items[0], options={})
 
     def sequence(self, items):
-        """Flatten sequence"""
-        return flatten(items)
+        """Return sequence items"""
+        return items
 
     def rest(self, items):
         """Return duration event"""
@@ -73,16 +116,16 @@ class ZiffersTransformer(Transformer):
             prefixes = sum_dict(items[0:-1])  # If there are prefixes
             text_prefix = prefixes.pop("text")
             prefixes["prefix"] = text_prefix
-            val = items[-1][1:-1].split(",")
+            val = RANDOM_INTEGER_RE.match(items[-1])
             return RandomInteger(
-                min=int(val[0]),
-                max=int(val[1]),
+                min=int(val[1]),
+                max=int(val[2]),
                 text=text_prefix + items[-1],
                 local_options=prefixes,
             )
         else:
-            val = items[0][1:-1].split(",")
-            return RandomInteger(min=int(val[0]), max=int(val[1]), text=items[0])
+            val = RANDOM_INTEGER_RE.match(items[0])
+            return RandomInteger(min=int(val[1]), max=int(val[2]), text=items[0])
 
     def random_integer_re(self, items):
         """Return random integer notation from regex"""
@@ -94,16 +137,16 @@ class ZiffersTransformer(Transformer):
             prefixes = sum_dict(items[0:-1])  # If there are prefixes
             text_prefix = prefixes.pop("text")
             prefixes["prefix"] = text_prefix
-            val = items[-1].split("..")
+            val = RANGE_RE.match(items[-1])
             return Range(
-                start=int(val[0]),
-                end=int(val[1]),
+                start=int(val[1]),
+                end=int(val[2]),
                 text=text_prefix + items[-1],
                 local_options=prefixes,
             )
         # Else
-        val = items[0].split("..")
-        return Range(start=int(val[0]), end=int(val[1]), text=items[0])
+        val = RANGE_RE.match(items[0])
+        return Range(start=int(val[1]), end=int(val[2]), text=items[0])
 
     def range_re(self, items):
         """Return range value from regex"""
@@ -135,30 +178,26 @@ class ZiffersTransformer(Transformer):
 
     def pitch(self, items):
         """Return pitch class info"""
-        text_value = items[0].value.replace("T", "10").replace("E", "11")
-        return {"pitch_class": int(text_value), "text": items[0].value}
+        text = items[0].value
+        pitch_class = PITCH_LETTERS.get(text)
+        if pitch_class is None:
+            pitch_class = int(text)
+        return {"pitch_class": pitch_class, "text": text}
 
     def escaped_pitch(self, items):
         """Return escaped pitch"""
         val = items[0].value[1:-1]
         return {"pitch_class": int(val), "text": val}
 
-    def prefix(self, items):
-        """Return prefix"""
-        return items[0]
-
     def oct_change(self, items):
         """Parses octave change"""
         octave = items[0]
-        return [
-            OctaveChange(value=octave["octave_change"], text=octave["text"]),
-            items[1],
-        ]
+        return OctaveChange(value=octave["octave_change"], text=octave["text"])
 
     def oct_mod(self, items):
         """Parses octave modification"""
         octave = items[0]
-        return [OctaveAdd(value=octave["octave"], text=octave["text"]), items[1]]
+        return OctaveAdd(value=octave["octave"], text=octave["text"])
 
     def escaped_octave(self, items):
         """Return octave info"""
@@ -167,8 +206,8 @@ class ZiffersTransformer(Transformer):
 
     def octave(self, items):
         """Return octaves ^ and _"""
-        value = sum(1 if char == "^" else -1 for char in items[0].value)
-        return {"octave": value, "text": items[0].value}
+        text = items[0].value
+        return {"octave": text.count("^") - text.count("_"), "text": text}
 
     def modifier(self, items):
         """Return modifiers # and b"""
@@ -180,10 +219,10 @@ class ZiffersTransformer(Transformer):
         if isinstance(items[-1], Token):
             return Chord(
                 pitch_classes=items[0:-1],
-                text="".join([val.text for val in items[0:-1]]),
+                text="".join(val.text for val in items[0:-1]),
                 inversions=int(items[-1].value[1:]),
             )
-        return Chord(pitch_classes=items, text="".join([val.text for val in items]))
+        return Chord(pitch_classes=items, text="".join(val.text for val in items))
 
     def invert(self, items):
         """Return chord inversion"""
@@ -232,28 +271,21 @@ class ZiffersTransformer(Transformer):
 
     def char_change(self, items):
         """Return partial duration char info"""
-        chars = ""
+        chars = []
         durs = 0.0
         for dchar, dots in items:
-            val = DEFAULT_DURS[dchar]
-            if dots > 0:
-                val = val * (2.0 - (1.0 / (2 * dots)))
-            chars = chars + (dchar + "." * dots)
-            durs = durs + val
-        return {"text": chars, "duration": durs}
+            durs += dotted_duration(dchar, dots)
+            chars.append(f"{dchar}{'.' * dots}")
+        return {"text": "".join(chars), "duration": durs}
 
     def dchar_not_prefix(self, items):
         """Return partial duration char info"""
-        dur = items[0].split(".", 1)
-        dots = 0
-        if len(dur) > 1:
-            dots = len(dur[1]) + 1
-        return [dur[0], dots]
+        return split_dots(items[0])
 
     def escaped_decimal(self, items):
         """Return partial decimal info"""
         val = items[0]
-        val["text"] = "<" + val["text"] + ">"
+        val["text"] = f"<{val['text']}>"
         return val
 
     def random_pitch(self, items):
@@ -266,18 +298,19 @@ class ZiffersTransformer(Transformer):
 
     def duration_chars(self, items):
         """Return partial duration info"""
-        durations = [val[1] for val in items]
-        characters = "".join([val[0] for val in items])
-        return {"duration": sum(durations), "text": characters}
+        characters = []
+        durs = 0.0
+        for chars, dur in items:
+            durs += dur
+            characters.append(chars)
+        return {"duration": durs, "text": "".join(characters)}
 
     def dotted_dur(self, items):
         """Return partial duration info"""
         key = items[0]
-        val = DEFAULT_DURS[key]
         dots = len(items) - 1
-        if dots > 0:
-            val = val * (2.0 - (1.0 / (2 * dots)))
-        return [key + "." * dots, val]
+        val = dotted_duration(key, dots)
+        return [f"{key}{'.' * dots}", val]
 
     def decimal(self, items):
         """Return partial duration info"""
@@ -295,11 +328,11 @@ class ZiffersTransformer(Transformer):
 
     def WS(self, items):
         """Parse whitespace"""
-        return Whitespace(text=items[0])
+        return whitespace(items[0])
 
     def subdivision(self, items):
         """Parse subdivision"""
-        values = flatten(items[0])
+        values = items[0]
         return Subdivision(values=values, wrap_start="[", wrap_end="]")
 
     def subitems(self, items):
@@ -321,8 +354,8 @@ class ZiffersTransformer(Transformer):
         if isinstance(items[0], dict):
             local_opts = items[0]
             del local_opts["text"]
-            return Operation(values=flatten(items[1:]), local_options=items[0])
-        return Operation(values=flatten(items))
+            return Operation(values=items[1:], local_options=items[0])
+        return Operation(values=items)
 
     def atom(self, token):
         """Return partial eval item"""
@@ -339,7 +372,7 @@ class ZiffersTransformer(Transformer):
         return VariableAssignment(
             variable=var,
             value=content,
-            text=var.text + "=" + content.text,
+            text=f"{var.text}={content.text}",
             pre_eval=True if op == "=" else False,
         )
 
@@ -363,7 +396,7 @@ class ZiffersTransformer(Transformer):
 
     def variablelist(self, items):
         """Return list of variables"""
-        return VariableList(values=items, text="".join([item.text for item in items]))
+        return VariableList(values=items, text="".join(item.text for item in items))
 
     # List rules
 
@@ -386,32 +419,31 @@ class ZiffersTransformer(Transformer):
 
     def repeated_list(self, items):
         """Parse repeated list notation ex: (: 1 2 3 :)"""
+        values, repeats = items[-2], items[-1]
         if len(items) > 2:
             prefixes = sum_dict(items[0:-2])  # If there are prefixes
-            if items[-1] is not None:
+            if repeats is not None:
                 seq = RepeatedListSequence(
-                    values=items[-2],
-                    repeats=items[-1],
-                    wrap_end=":" + items[-1].text + ")",
+                    values=values,
+                    repeats=repeats,
+                    wrap_end=f":{repeats.text})",
                     local_options=prefixes,
                 )
             else:
                 seq = RepeatedListSequence(
-                    values=items[-2],
+                    values=values,
                     repeats=Integer(text="2", value=2, local_options=prefixes),
                 )
             return seq
         else:
-            if items[-1] is not None:
+            if repeats is not None:
                 seq = RepeatedListSequence(
-                    values=items[-2],
-                    repeats=items[-1],
-                    wrap_end=":" + items[-1].text + ")",
+                    values=values,
+                    repeats=repeats,
+                    wrap_end=f":{repeats.text})",
                 )
             else:
-                seq = RepeatedListSequence(
-                    values=items[-2], repeats=Integer(text="2", value=2)
-                )
+                seq = RepeatedListSequence(values=values, repeats=DEFAULT_REPEATS)
             return seq
 
     def integer(self, items):
@@ -420,10 +452,6 @@ class ZiffersTransformer(Transformer):
         val = concatted["text"]
         return Integer(text=val, value=int(val))
 
-    def number(self, item):
-        """Return partial number (Integer or RandomInteger)"""
-        return item[0]
-
     def cyclic_number(self, item):
         """Parse cyclic notation"""
         return Cyclic(values=item)
@@ -435,7 +463,7 @@ class ZiffersTransformer(Transformer):
         return LispOperation(
             operator=op,
             values=values,
-            text="(+" + "".join([v.text for v in values]) + ")",
+            text=f"(+{''.join(v.text for v in values)})",
         )
 
     def operator(self, token):
@@ -456,17 +484,13 @@ class ZiffersTransformer(Transformer):
         """Parse list operation"""
         return ListOperation(values=items)
 
-    def right_op(self, items):
-        """Get right value for the operation"""
-        return items[0]
-
     def euclid(self, items):
         """Parse euclid notation"""
-        params = items[1][1:-1].split(",")
-        init = {"onset": items[0], "pulses": int(params[0]), "length": int(params[1])}
+        params = EUCLID_RE.match(items[1])
+        init = {"onset": items[0], "pulses": int(params[1]), "length": int(params[2])}
         text = items[0].text + items[1]
-        if len(params) > 2:
-            init["rotate"] = int(params[2])
+        if params[3] is not None:
+            init["rotate"] = int(params[3])
         if len(items) > 2:
             init["offset"] = items[2]
             text = text + items[2].text
@@ -481,10 +505,10 @@ class ZiffersTransformer(Transformer):
         """Parse repeated sequence, ex: [: 1 2 3 :]"""
         if items[-1] is not None:
             return RepeatedSequence(
-                values=items[0], repeats=items[-1], wrap_end=":" + items[-1].text + "]"
+                values=items[0], repeats=items[-1], wrap_end=f":{items[-1].text}]"
             )
         else:
-            return RepeatedSequence(values=items[0], repeats=Integer(value=2, text="2"))
+            return RepeatedSequence(values=items[0], repeats=DEFAULT_REPEATS)
 
     def repeat_item(self, items):
         """Parse repeat item syntax to sequence, ex: 1:4 (1 2 3):5"""
@@ -496,7 +520,13 @@ class ZiffersTransformer(Transformer):
         )
 
 
-# pylint: disable=locally-disabled, unused-argument, too-many-public-methods, invalid-name, eval-used
+def _apply_operator(values: list, operator: str):
+    """Replace the two topmost values with the result of the operator"""
+    right = values.pop()
+    values[-1] = OPERATORS[operator](values[-1], right)
+
+
+# pylint: disable=locally-disabled, unused-argument, too-many-public-methods, invalid-name
 class ScalaTransformer(Transformer):
     """Transformer for scala scales"""
 
@@ -509,9 +539,18 @@ class ScalaTransformer(Transformer):
 
     def operation(self, items):
         """Get operation"""
-        # Safe eval. Items are pre-parsed.
-        val = eval("".join(str(item) for item in items))
-        return val
+        # Evaluate infix items with Python operator precedence
+        values = [items[0]]
+        operators = []
+        for index in range(1, len(items), 2):
+            operator = items[index]
+            while operators and SCALA_PRECEDENCE[operators[-1]] >= SCALA_PRECEDENCE[operator]:
+                _apply_operator(values, operators.pop())
+            operators.append(operator)
+            values.append(items[index + 1])
+        while operators:
+            _apply_operator(values, operators.pop())
+        return values[0]
 
     def operator(self, items):
         """Get operator"""
@@ -519,7 +558,7 @@ class ScalaTransformer(Transformer):
 
     def sub_operations(self, items):
         """Get sub-operation"""
-        return "(" + items[0] + ")"
+        return items[0]
 
     def frac_ratio(self, items):
         """Get ration as fraction"""
@@ -528,7 +567,7 @@ class ScalaTransformer(Transformer):
 
     def decimal_ratio(self, items):
         """Get ratio as decimal"""
-        ratio = float(str(items[0]) + "." + str(items[1]))
+        ratio = float(f"{items[0]}.{items[1]}")
         return ratio_to_cents(ratio)
 
     def monzo(self, items):
@@ -17,15 +17,22 @@ ziffers_parser = Lark.open(
     start="root",
     parser="lalr",
     transformer=ZiffersTransformer(),
+    cache=True,
 )
 
-scala_parser = Lark.open(
-    str(scala_grammar),
-    rel_to=__file__,
-    start="root",
-    parser="lalr",
-    transformer=ScalaTransformer(),
-)
+
+@lru_cache
+def get_scala_parser() -> Lark:
+    """Build the Scala parser on first use, as most expressions never need it"""
+    return Lark.open(
+        str(scala_grammar),
+        rel_to=__file__,
+        start="root",
+        parser="lalr",
+        transformer=ScalaTransformer(),
+        cache=True,
+    )
+
 
 def parse_scala(expr: str):
     """Parse an expression using the Ziffers parser
@@ -38,7 +45,7 @@ def parse_scala(expr: str):
     """
     # Ignore everything before last comment "!"
     values = expr.split("!")[-1]
-    return scala_parser.parse(values)
+    return get_scala_parser().parse(values)
 
 
 def parse_expression(expr: str) -> Ziffers:
@@ -52,7 +59,6 @@ def parse_expression(expr: str) -> Ziffers:
     """
     return ziffers_parser.parse(expr)
 
-@lru_cache
 def zparse(expr: str, **opts) -> Ziffers:
     """Parses ziffers expression with options
 
@@ -63,6 +69,37 @@ def zparse(expr: str, **opts) -> Ziffers:
     Returns:
         Ziffers: Returns Ziffers iterable parsed with the given options
     """
+    # Options are keyed regardless of the keyword order. Value types are part
+    # of the key so that eg. int and float scales are not cached as equal.
+    opts_key = tuple(
+        sorted((name, value, _value_types(value)) for name, value in opts.items())
+    )
+    try:
+        hash(opts_key)
+    except TypeError:
+        # Unhashable options, eg. scale as a list, are parsed without caching
+        return _parse_with_options(expr, opts)
+    return _cached_zparse(expr, opts_key)
+
+
+@lru_cache
+def _cached_zparse(expr: str, opts_key: tuple) -> Ziffers:
+    """Cached zparse for options that can be hashed"""
+    return _parse_with_options(expr, {name: value for name, value, _ in opts_key})
+
+
+zparse.cache_clear = _cached_zparse.cache_clear
+
+
+def _value_types(value) -> tuple:
+    """Return types of the option value and its items"""
+    if isinstance(value, (tuple, list)):
+        return tuple(type(item) for item in value)
+    return (type(value),)
+
+
+def _parse_with_options(expr: str, opts: dict) -> Ziffers:
+    """Parse expression and initialize it with the options"""
     if "scale" in opts:
         scale = opts["scale"]
         if isinstance(scale,str) and not scale.isalpha():
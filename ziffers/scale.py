@@ -3,7 +3,8 @@
 # pylint: disable=locally-disabled, no-name-in-module
 import re
 from math import log2
-from itertools import islice
+from functools import lru_cache
+from itertools import accumulate, islice, pairwise
 from .generators import gen_primes
 from .common import repeat_text
 from .defaults import (
@@ -12,10 +13,22 @@ from .defaults import (
     NOTES_TO_INTERVALS,
     INTERVALS_TO_NOTES,
     ROMANS,
-    CIRCLE_OF_FIFTHS,
+    FIFTHS_ACCIDENTALS,
+    PITCH_CLASS_ACCIDENTALS,
     CHORDS,
 )
 
+# Patterns for note names with and without octave, ex: C# and C#4
+NOTE_NAME_RE = re.compile(r"^([a-gA-G])([#bs])?$")
+SCIENTIFIC_NOTE_RE = re.compile(r"^([a-gA-G])([#bs])?([1-9])?$")
+
+# Pitch class texts for each semitone spelled with sharps or flats
+SHARP_PITCH_CLASSES = ("0", "#0", "1", "#1", "2", "3", "#3", "4", "#4", "5", "#5", "6")
+FLAT_PITCH_CLASSES = ("0", "b1", "1", "b2", "2", "3", "b4", "4", "b5", "5", "b6", "6")
+
+# Primes for monzos, longer monzos generate more
+PRIMES = tuple(islice(gen_primes(), 24))
+
 
 def midi_to_note_name(midi: int) -> str:
     """Creates note name from midi number
@@ -29,6 +42,7 @@ def midi_to_note_name(midi: int) -> str:
     return INTERVALS_TO_NOTES[midi % 12]
 
 
+@lru_cache
 def note_name_to_interval(name: str) -> int:
     """Parse note name to interval
 
@@ -38,7 +52,7 @@ def note_name_to_interval(name: str) -> int:
     Returns:
         int: Interval of the note name [-1 - 11]
     """
-    items = re.match(r"^([a-gA-G])([#bs])?$", name)
+    items = NOTE_NAME_RE.match(name)
     if items is None:
         return 0
     values = items.groups()
@@ -53,6 +67,7 @@ def midi_to_freq(note: int) -> float:
     return (freq / 32) * (2 ** ((note - 9) / 12))
 
 
+@lru_cache
 def note_name_to_midi(name: str) -> int:
     """Parse note name to midi
 
@@ -62,7 +77,7 @@ def note_name_to_midi(name: str) -> int:
     Returns:
         int: Midi note
     """
-    items = re.match(r"^([a-gA-G])([#bs])?([1-9])?$", name)
+    items = SCIENTIFIC_NOTE_RE.match(name)
     if items is None:
         return 60
     values = items.groups()
@@ -84,8 +99,20 @@ def get_scale(scale: str) -> list[int]:
     if isinstance(scale, (list, tuple)):
         return scale
 
-    scale = SCALES.get(scale.lower().capitalize(), SCALES["Ionian"])
-    return scale
+    return scale_from_name(scale)
+
+
+@lru_cache
+def scale_from_name(name: str) -> tuple[int]:
+    """Look up scale by name, defaulting to Ionian
+
+    Args:
+        name (str): Name of the scale in any letter case
+
+    Returns:
+        tuple: Intervals of the scale
+    """
+    return SCALES.get(name.lower().capitalize(), SCALES["Ionian"])
 
 
 def get_scale_notes(name: str, root: int = 60, num_octaves: int = 1) -> list[int]:
@@ -100,10 +127,7 @@ def get_scale_notes(name: str, root: int = 60, num_octaves: int = 1) -> list[int
         list[int]: List of notes
     """
     scale = get_scale(name)
-    scale_notes = [root]
-    for _ in range(num_octaves):
-        scale_notes = scale_notes + [root := root + semitone for semitone in scale]
-    return scale_notes
+    return list(accumulate(scale * num_octaves, initial=root))
 
 
 def get_chord_from_scale(
@@ -147,7 +171,32 @@ def get_scale_length(scale: str) -> int:
     if isinstance(scale, (list, tuple)):
         return len(scale)
 
-    return len(SCALES.get(scale.lower().capitalize(), SCALES["Ionian"]))
+    return len(scale_from_name(scale))
+
+
+def scale_steps(intervals: tuple[int | float]) -> tuple[int | float]:
+    """Sums of the intervals up to each degree of the scale
+
+    Args:
+        intervals (tuple[int | float]): Intervals of the scale
+
+    Returns:
+        tuple: Distance of each degree from the root, ending with the span of the scale
+    """
+    return tuple(accumulate(intervals, initial=0))
+
+
+@lru_cache
+def scale_steps_from_name(name: str) -> tuple[int]:
+    """Sums of the intervals up to each degree of the named scale
+
+    Args:
+        name (str): Name of the scale in any letter case
+
+    Returns:
+        tuple: Distance of each degree from the root, ending with the span of the scale
+    """
+    return scale_steps(scale_from_name(name))
 
 
 # pylint: disable=locally-disabled, too-many-arguments
@@ -165,7 +214,6 @@ def note_from_pc(
         root (int | str): Root of the scale in MIDI or scientific pitch notation
         pitch_class (int): Pitch class to be resolved
         intervals (str | list[int  |  float]): Name or Intervals for the scale
-        cents (bool, optional): Flag for interpreting intervals as cents. Defaults to False.
         octave (int, optional): Default octave. Defaults to 0.
         modifier (int, optional): Modifier for the pitch class (#=1, b=-1). Defaults to 0.
 
@@ -176,8 +224,12 @@ def note_from_pc(
     # Initialization
     pitch_class = pitch_class-1 if degrees and pitch_class>0 else pitch_class
     root = note_name_to_midi(root) if isinstance(root, str) else root
-    intervals = get_scale(intervals) if isinstance(intervals, str) else intervals
-    scale_length = len(intervals)
+    # Only named scales are cached, as equal int and float intervals would share a key
+    if isinstance(intervals, str):
+        steps = scale_steps_from_name(intervals)
+    else:
+        steps = scale_steps(intervals)
+    scale_length = len(steps) - 1
 
     # Resolve pitch classes to the scale and calculate octave
     if pitch_class >= scale_length or pitch_class < 0:
@@ -191,9 +243,9 @@ def note_from_pc(
             pitch_class = 0
 
     # Computing the result
-    note = root + sum(intervals[0:pitch_class])
+    note = root + steps[pitch_class]
 
-    note = note + (octave * sum(intervals)) + modifier
+    note = note + (octave * steps[-1]) + modifier
 
     if isinstance(note, float):
         return resolve_pitch_bend(note)
@@ -201,6 +253,7 @@ def note_from_pc(
     return (note, None)
 
 
+@lru_cache
 def parse_roman(numeral: str) -> int:
     """Parse roman numeral from string
 
@@ -211,18 +264,14 @@ def parse_roman(numeral: str) -> int:
         int: Integer parsed from roman numeral
     """
     values = [ROMANS[val] for val in numeral]
-    result = 0
-    i = 0
-    while i < len(values):
-        if i < len(values) - 1 and values[i + 1] > values[i]:
-            result += values[i + 1] - values[i]
-            i += 2
-        else:
-            result += values[i]
-            i += 1
-    return result
+    # Numeral smaller than the following one is subtracted, ex: iv
+    return sum(
+        -value if value < following else value
+        for value, following in zip(values, values[1:] + [0])
+    )
 
 
+@lru_cache
 def accidentals_from_note_name(name: str) -> int:
     """Generates number of accidentals from name of the note.
 
@@ -232,11 +281,10 @@ def accidentals_from_note_name(name: str) -> int:
     Returns:
         int: Integer representing number of flats or sharps: -7 flat to 7 sharp.
     """
-    if name not in CIRCLE_OF_FIFTHS:
-        name = midi_to_note_name(note_name_to_midi(name))
-
-    idx = CIRCLE_OF_FIFTHS.index(name)
-    return idx - 6
+    accidentals = FIFTHS_ACCIDENTALS.get(name)
+    if accidentals is None:
+        accidentals = FIFTHS_ACCIDENTALS[midi_to_note_name(note_name_to_midi(name))]
+    return accidentals
 
 
 def accidentals_from_midi_note(note: int) -> int:
@@ -248,8 +296,7 @@ def accidentals_from_midi_note(note: int) -> int:
     Returns:
         int: Integer representing number of flats or sharps: -7 flat to 7 sharp.
     """
-    name = midi_to_note_name(note)
-    return accidentals_from_note_name(name)
+    return PITCH_CLASS_ACCIDENTALS[note % 12]
 
 
 def midi_to_tpc(note: int, key: str | int):
@@ -297,8 +344,8 @@ def midi_to_pitch_class(note: int, key: str | int, scale: str) -> dict:
     if isinstance(scale, str) and scale.upper() == "CHROMATIC":
         return {"text": str(pitch_class), "pitch_class": pitch_class, "octave": octave}
 
-    sharps = ["0", "#0", "1", "#1", "2", "3", "#3", "4", "#4", "5", "#5", "6"]
-    flats = ["0", "b1", "1", "b2", "2", "3", "b4", "4", "b5", "5", "b6", "6"]
+    sharps = SHARP_PITCH_CLASSES
+    flats = FLAT_PITCH_CLASSES
     tpc = midi_to_tpc(note, key)
     if tpc >= 6 and tpc <= 12 and len(flats[pitch_class]) == 2:
         npc = flats[pitch_class]
@@ -372,11 +419,11 @@ def named_chord_from_degree(
     """
     intervals = CHORDS.get(name, CHORDS["major"])
     scale_degree = get_scale_notes(scale, root)[degree - 1]
-    notes = []
-    for cur_oct in range(num_octaves):
-        for interval in intervals:
-            notes.append(scale_degree + interval + (cur_oct * 12))
-    return notes
+    return [
+        scale_degree + interval + (cur_oct * 12)
+        for cur_oct in range(num_octaves)
+        for interval in intervals
+    ]
 
 
 def resolve_pitch_bend(note_value: float, semitones: int = 1) -> int:
@@ -395,8 +442,9 @@ def resolve_pitch_bend(note_value: float, semitones: int = 1) -> int:
             note_value if note_value > round(note_value) else round(note_value)
         )
         end_value = round(note_value) if note_value > round(note_value) else note_value
-        bend_diff = midi_to_freq(start_value) / midi_to_freq(end_value)
-        bend_target = 1200 * log2(bend_diff)
+        # Bend in cents is 1200 * log2 of the frequency ratio, which is
+        # exactly 100 cents for each semitone between the midi notes
+        bend_target = 100 * (start_value - end_value)
         # https://www.cs.cmu.edu/~rbd/doc/cmt/part7.html
         midi_bend_value = 8192 + int(8191 * (bend_target / (100 * semitones)))
     return (note_value, midi_bend_value)
@@ -406,11 +454,7 @@ def cents_to_semitones(cents: list) -> tuple[float]:
     """Tranform cents to semitones"""
     if cents[0] != 0.0:
         cents = [0.0] + cents
-    semitone_scale = []
-    for i, cent in enumerate(cents[:-1]):
-        semitone_interval = (cents[i + 1] - cent) / 100
-        semitone_scale.append(semitone_interval)
-    return tuple(semitone_scale)
+    return tuple((upper - lower) / 100 for lower, upper in pairwise(cents))
 
 
 def ratio_to_cents(ratio: float) -> float:
@@ -430,7 +474,7 @@ def monzo_to_cents(monzo) -> float:
     """
     # Calculate the prime factors of the indices in the monzo
     max_index = len(monzo)
-    primes = list(islice(gen_primes(), max_index + 1))
+    primes = PRIMES if max_index <= len(PRIMES) else tuple(islice(gen_primes(), max_index))
 
     # Product of the prime factors raised to the corresponding exponents
     ratio = 1